@@ -5,6 +5,13 @@ plan for any skill or technology using resources from YouTube and Medium.  See
 the :mod:`cli` module for command‑line usage.
 """
 
-from .cli import main as run
+__all__ = ["run"]
 
-__all__ = ["run"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    # Import the CLI (and through it the clients) only when ``run`` is used
+    if name == "run":
+        from .cli import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
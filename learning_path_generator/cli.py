@@ -12,15 +12,11 @@ python -m learning_path_generator.cli --skill "React" --youtube-api-key YOUR_KEY
 from __future__ import annotations
 
 import argparse
+import io
 import os
 import sys
 from typing import List
 
-try:
-    from tabulate import tabulate  # type: ignore
-except ImportError:
-    tabulate = None  # type: ignore
-
 from .learning_path import generate_learning_path
 
 
@@ -64,10 +60,22 @@ def main() -> None:
         help="Ordering for YouTube search results (date, rating, relevance, title, viewCount).",
     )
     parser.add_argument(
-        "--no-table",
+        "--no-durations",
+        action="store_true",
+        help="Skip the videos.list duration lookups (one YouTube API request per 50 videos).",
+    )
+    parser.add_argument(
+        "--no-cache",
         action="store_true",
-        help="Disable tabular formatting even if the tabulate package is installed.",
+        help="Ignore plans cached on disk by earlier runs and do not cache this one.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Format resources as tables using the tabulate package, if installed.",
+    )
+    # Plain output is now the default; kept so existing invocations still parse.
+    parser.add_argument("--no-table", action="store_true", help=argparse.SUPPRESS)
     args = parser.parse_args()
 
     if not args.youtube_api_key:
@@ -83,67 +91,87 @@ def main() -> None:
         videos_per_week=args.videos_per_week,
         articles_per_week=args.articles_per_week,
         search_order=args.search_order,
+        fetch_durations=not args.no_durations,
+        use_cache=not args.no_cache,
     )
 
     # Print the plan
-    print_learning_plan(plan, use_table=not args.no_table)
+    print_learning_plan(plan, use_table=args.pretty)
+
 
+def print_learning_plan(plan: List[dict], use_table: bool = False) -> None:
+    """Pretty-print the learning plan to stdout.
 
-def print_learning_plan(plan: List[dict], use_table: bool = True) -> None:
-    """Pretty-print the learning plan to stdout."""
+    Resources are printed as fixed-width columns. Pass ``use_table=True`` to
+    render them with :mod:`tabulate` instead, when it is installed. The
+    output is built in memory and written to stdout in one call.
+    """
+    tabulate = None
+    if use_table:
+        try:
+            from tabulate import tabulate  # type: ignore
+        except ImportError:
+            pass
+    buf = io.StringIO()
     for week in plan:
         week_num = week["week"]
         theme = week["theme"]
         videos = week["videos"]
         articles = week["articles"]
         activities = week["activities"]
-        print(f"\nWeek {week_num}: {theme}")
+        buf.write(f"\nWeek {week_num}: {theme}\n")
         # Videos
         if videos:
-            print("  Videos:")
+            buf.write("  Videos:\n")
             rows = []
             for idx, vid in enumerate(videos, start=1):
-                title = vid["title"]
-                url = vid["url"]
-                duration = vid["duration"] or "--"
+                title = vid.title
+                url = vid.url
+                duration = vid.duration or "--"
                 rows.append([str(idx), title, duration, url])
-            if tabulate and use_table:
-                print(
+            if tabulate:
+                buf.write(
                     tabulate(
                         rows,
                         headers=["#", "Title", "Duration", "URL"],
                         tablefmt="github",
                     )
                 )
+                buf.write("\n")
             else:
-                for row in rows:
-                    print(f"    {row[0]}. {row[1]} ({row[2]}) – {row[3]}")
+                # Bake the column widths into the row template once per table
+                w0, w1, w2 = (max(len(row[i]) for row in rows) for i in range(3))
+                fmt = f"    {{:>{w0}}}. {{:<{w1}}}  {{:>{w2}}}  {{}}\n"
+                buf.write("".join(fmt.format(*row) for row in rows))
         else:
-            print("  Videos: None")
+            buf.write("  Videos: None\n")
         # Articles
         if articles:
-            print("  Articles:")
+            buf.write("  Articles:\n")
             rows = []
             for idx, art in enumerate(articles, start=1):
-                title = art["title"]
-                url = art["url"]
+                title = art.title
+                url = art.url
                 rows.append([str(idx), title, url])
-            if tabulate and use_table:
-                print(
+            if tabulate:
+                buf.write(
                     tabulate(
                         rows,
                         headers=["#", "Title", "URL"],
                         tablefmt="github",
                     )
                 )
+                buf.write("\n")
             else:
-                for row in rows:
-                    print(f"    {row[0]}. {row[1]} – {row[2]}")
+                w0, w1 = (max(len(row[i]) for row in rows) for i in range(2))
+                fmt = f"    {{:>{w0}}}. {{:<{w1}}}  {{}}\n"
+                buf.write("".join(fmt.format(*row) for row in rows))
         else:
-            print("  Articles: None")
+            buf.write("  Articles: None\n")
         # Activities
-        print("  Suggested activities:")
-        print(f"    {activities}")
+        buf.write("  Suggested activities:\n")
+        buf.write(f"    {activities}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
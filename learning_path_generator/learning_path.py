@@ -8,11 +8,22 @@ activities.
 
 from __future__ import annotations
 
-import re
+import functools
+import hashlib
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
 from typing import Dict, List, Optional
 
 from . import youtube_client, medium_client
 
+# Generated plans are cached on disk for a day so repeat runs skip the network
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "learning-path")
+_CACHE_EXPIRE = 24 * 60 * 60
+# Part of the cache key; bump whenever the layout of a cached plan changes
+_CACHE_VERSION = 2
+
 
 def generate_learning_path(
     skill: str,
@@ -21,6 +32,8 @@ def generate_learning_path(
     videos_per_week: int = 2,
     articles_per_week: int = 2,
     search_order: str = "relevance",
+    fetch_durations: bool = True,
+    use_cache: bool = True,
 ) -> List[Dict[str, object]]:
     """Generate a structured learning plan for the given skill.
 
@@ -39,41 +52,69 @@ def generate_learning_path(
     search_order: str, optional
         Ordering of YouTube search results. See the YouTube API docs for
         acceptable values (e.g. 'relevance', 'viewCount', 'date').
+    fetch_durations: bool, optional
+        Whether to look up video durations, which costs an extra YouTube
+        request. Default is True.
+    use_cache: bool, optional
+        Whether to reuse a plan cached on disk for the same arguments within
+        the last day, and to cache this one. Requires the ``diskcache``
+        package; ignored if it is not installed. Default is True.
 
     Returns
     -------
     list of dict
         A list where each element corresponds to a week and contains keys:
-        'week', 'theme', 'videos', 'articles', 'activities'.
+        'week', 'theme', 'videos', 'articles', 'activities'. The 'videos' and
+        'articles' entries are lists of :class:`~.youtube_client.Video` and
+        :class:`~.medium_client.Article` records.
     """
+    cache = _plan_cache() if use_cache else None
+    cache_key = hashlib.sha1(
+        repr(
+            (
+                _CACHE_VERSION,
+                skill,
+                weeks,
+                videos_per_week,
+                articles_per_week,
+                search_order,
+                fetch_durations,
+            )
+        ).encode()
+    ).hexdigest()
+    if cache is not None:
+        cached_plan = _cache_call(cache.get, cache_key)
+        if cached_plan is not None:
+            return cached_plan
     # Total resources to fetch
     total_videos = weeks * videos_per_week
     total_articles = weeks * articles_per_week
-    # Search for videos on YouTube
     # Add the keyword 'tutorial' to the query to improve relevance
     video_query = f"{skill} tutorial"
-    videos = youtube_client.search_videos(
-        api_key=youtube_api_key,
-        query=video_query,
-        max_results=total_videos,
-        order=search_order,
-    )
-    # Fetch Medium articles
     # Convert spaces to hyphens and lowercase for tag slug
-    tag_slug = re.sub(r"\s+", "-", skill.strip().lower())
-    articles = medium_client.get_articles_for_tag(tag_slug, max_articles=total_articles)
-    # Fill lists to required length (repeat if necessary)
-    if not videos:
-        videos = []
-    if not articles:
-        articles = []
-    # Repeat resources if there are not enough items
-    while len(videos) < total_videos and videos:
-        videos.extend(videos)
-    while len(articles) < total_articles and articles:
-        articles.extend(articles)
-    videos = videos[:total_videos]
-    articles = articles[:total_articles]
+    tag_slug = "-".join(skill.lower().split())
+    # The YouTube search and the Medium feed fetch are independent network
+    # calls, so run them side by side rather than one after the other.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        videos_future = pool.submit(
+            youtube_client.search_videos_with_status,
+            api_key=youtube_api_key,
+            query=video_query,
+            max_results=total_videos,
+            order=search_order,
+            fetch_durations=fetch_durations,
+        )
+        articles_future = pool.submit(
+            medium_client.get_articles_with_status, tag_slug, max_articles=total_articles
+        )
+        videos, videos_complete = videos_future.result()
+        articles, articles_complete = articles_future.result()
+    # Fill lists to required length, repeating resources if there are not
+    # enough items
+    if videos:
+        videos = list(islice(cycle(videos), total_videos))
+    if articles:
+        articles = list(islice(cycle(articles), total_articles))
     # Generic themes for weeks (can be customised)
     default_themes = [
         "Foundations",
@@ -81,44 +122,71 @@ def generate_learning_path(
         "Advanced Topics",
         "Project & Practice",
     ]
-    # Build plan
-    plan: List[Dict[str, object]] = []
-    for week_num in range(weeks):
-        week_videos = videos[week_num * videos_per_week : (week_num + 1) * videos_per_week]
-        week_articles = articles[week_num * articles_per_week : (week_num + 1) * articles_per_week]
-        theme = default_themes[week_num] if week_num < len(default_themes) else f"Week {week_num + 1}"
-        activities = _suggest_activities(week_num, skill)
-        plan.append(
-            {
-                "week": week_num + 1,
-                "theme": theme,
-                "videos": week_videos,
-                "articles": week_articles,
-                "activities": activities,
-            }
-        )
+    # Build plan, one entry per week with its slice of each resource list
+    plan: List[Dict[str, object]] = [
+        {
+            "week": week_num + 1,
+            "theme": default_themes[week_num] if week_num < len(default_themes) else f"Week {week_num + 1}",
+            "videos": videos[week_num * videos_per_week : (week_num + 1) * videos_per_week],
+            "articles": articles[week_num * articles_per_week : (week_num + 1) * articles_per_week],
+            "activities": _suggest_activities(week_num, skill),
+        }
+        for week_num in range(weeks)
+    ]
+    # Only cache complete plans, so a failed fetch (including a failed
+    # duration lookup or a partially parsed feed) is retried on the next run
+    fetched_all = (
+        videos_complete
+        and articles_complete
+        and (videos or not total_videos)
+        and (articles or not total_articles)
+    )
+    if cache is not None and fetched_all:
+        _cache_call(cache.set, cache_key, plan, expire=_CACHE_EXPIRE)
     return plan
 
 
+@functools.lru_cache(maxsize=None)
+def _plan_cache() -> Optional["diskcache.Cache"]:
+    """Return the on-disk plan cache, or None if it is unavailable.
+
+    The cache is optional: a missing diskcache package or a cache directory
+    that cannot be created or opened just disables it.
+    """
+    try:
+        import diskcache  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return diskcache.Cache(_CACHE_DIR)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _cache_call(method, *args, **kwargs):
+    """Call a plan cache method, returning None if the cache fails."""
+    import diskcache  # type: ignore
+
+    try:
+        return method(*args, **kwargs)
+    except (OSError, sqlite3.Error, diskcache.Timeout):
+        return None
+
+
+# Practice activities by week; weeks past the end reuse the last entry
+_ACTIVITY_TEMPLATES = (
+    "Set up your environment for {skill}. Work through basic examples "
+    "covered in the videos and summarise the key concepts in your own words.",
+    "Experiment with building small components or programs using {skill}. "
+    "Complete exercises from articles and implement variations.",
+    "Apply what you’ve learned to a mini‑project. Focus on more advanced features "
+    "and read deeper resources.",
+    "Develop a capstone project incorporating multiple concepts of {skill}. "
+    "Write a blog post or create a video summarising your project and share it.",
+)
+
+
 def _suggest_activities(week_index: int, skill: str) -> str:
     """Return suggested practice activities for a given week index."""
-    if week_index == 0:
-        return (
-            f"Set up your environment for {skill}. Work through basic examples "
-            "covered in the videos and summarise the key concepts in your own words."
-        )
-    elif week_index == 1:
-        return (
-            f"Experiment with building small components or programs using {skill}. "
-            "Complete exercises from articles and implement variations."
-        )
-    elif week_index == 2:
-        return (
-            f"Apply what you’ve learned to a mini‑project. Focus on more advanced features "
-            "and read deeper resources."
-        )
-    else:
-        return (
-            f"Develop a capstone project incorporating multiple concepts of {skill}. "
-            "Write a blog post or create a video summarising your project and share it."
-        )
+    template = _ACTIVITY_TEMPLATES[min(week_index, len(_ACTIVITY_TEMPLATES) - 1)]
+    return template.format(skill=skill)
@@ -10,12 +10,42 @@ the RSS feed【574958521376438†L22-L24】.
 
 from __future__ import annotations
 
-from typing import Dict, List
+import functools
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from typing import List, NamedTuple, Tuple
 
-import feedparser
+# Namespaced RSS elements Medium uses alongside the plain RSS 2.0 ones
+_ATOM_UPDATED = "{http://www.w3.org/2005/Atom}updated"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
 
 
-def get_articles_for_tag(tag: str, max_articles: int = 10) -> List[Dict[str, str]]:
+@functools.lru_cache(maxsize=None)
+def _client():
+    """Return the shared HTTP client, creating it (and importing httpx) on first use.
+
+    Sharing one client lets repeated feed fetches reuse a kept-alive connection.
+    """
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        follow_redirects=True,
+        timeout=10.0,
+    )
+
+
+class Article(NamedTuple):
+    """A Medium article read from a tag feed."""
+
+    title: str
+    url: str
+    published: str
+    summary: str
+
+
+def get_articles_for_tag(tag: str, max_articles: int = 10) -> List[Article]:
     """Return a list of recent Medium articles for a specific tag.
 
     Parameters
@@ -27,25 +57,92 @@ def get_articles_for_tag(tag: str, max_articles: int = 10) -> List[Dict[str, str
 
     Returns
     -------
-    list of dict
-        Each dictionary contains keys: 'title', 'url', 'published', and
+    list of Article
+        Each record has the fields 'title', 'url', 'published', and
         'summary'. If fewer than ``max_articles`` are available, all entries
         are returned.
+
+    Results are cached per ``(tag, max_articles)`` for the lifetime of the
+    process; failed or partially parsed fetches are not cached.
+    """
+    articles, _ = get_articles_with_status(tag, max_articles)
+    return articles
+
+
+def get_articles_with_status(
+    tag: str, max_articles: int = 10
+) -> Tuple[List[Article], bool]:
+    """Like :func:`get_articles_for_tag`, but also report whether the fetch succeeded.
+
+    Returns
+    -------
+    tuple of (list of Article, bool)
+        The articles, and False if the feed could not be fetched or was only
+        partially parsed. In the partial case the articles read before the
+        malformed part of the feed are still returned.
     """
+    import httpx
+
+    try:
+        return list(_get_articles_for_tag(tag, max_articles)), True
+    except _PartialFeedError as exc:
+        print(f"Medium feed error: {exc.error} (kept {len(exc.articles)} articles)")
+        return list(exc.articles), False
+    except (httpx.HTTPError, ET.ParseError) as exc:
+        print(f"Medium feed error: {exc}")
+        return [], False
+
+
+class _PartialFeedError(Exception):
+    """Raised when a feed breaks off after some articles were parsed."""
+
+    def __init__(self, articles: List[Article], error: ET.ParseError) -> None:
+        super().__init__(str(error))
+        self.articles = articles
+        self.error = error
+
+
+@functools.lru_cache(maxsize=256)
+def _get_articles_for_tag(tag: str, max_articles: int) -> Tuple[Article, ...]:
+    """Fetch and parse the feed; HTTP and XML errors propagate."""
+    if max_articles <= 0:
+        return ()
     feed_url = f"https://medium.com/feed/tag/{tag}"
-    parsed = feedparser.parse(feed_url)
-    articles: List[Dict[str, str]] = []
-    for entry in parsed.entries[:max_articles]:
-        title = entry.get("title", "")
-        url = entry.get("link", "")
-        published = entry.get("published", "") or entry.get("updated", "")
-        summary = entry.get("summary", "")
-        articles.append(
-            {
-                "title": title,
-                "url": url,
-                "published": published,
-                "summary": summary,
-            }
-        )
+    response = _client().get(feed_url)
+    response.raise_for_status()
+    return tuple(_parse_feed(response.content, max_articles))
+
+
+def _parse_feed(data: bytes, max_articles: int) -> List[Article]:
+    """Parse up to ``max_articles`` items from RSS feed bytes.
+
+    Raises ``ET.ParseError`` if the feed is malformed before the first
+    complete ``<item>``, or :class:`_PartialFeedError` (carrying the articles
+    read so far) if it is malformed later on.
+    """
+    articles: List[Article] = []
+    if max_articles <= 0:
+        return articles
+    # Walk <item> elements as they are parsed and stop once we have enough,
+    # rather than building the whole feed document.
+    try:
+        for _, elem in ET.iterparse(BytesIO(data)):
+            if elem.tag != "item":
+                continue
+            title = elem.findtext("title", "")
+            url = elem.findtext("link", "")
+            published = elem.findtext("pubDate", "") or elem.findtext(_ATOM_UPDATED, "")
+            summary = elem.findtext("description", "") or elem.findtext(_CONTENT_ENCODED, "")
+            articles.append(
+                Article(title=title, url=url, published=published, summary=summary)
+            )
+            elem.clear()
+            if len(articles) >= max_articles:
+                break
+    except ET.ParseError as exc:
+        # The parser is strict, unlike feedparser was; keep the articles read
+        # before the malformed part of the feed rather than dropping them all.
+        if not articles:
+            raise
+        raise _PartialFeedError(articles, exc) from exc
     return articles
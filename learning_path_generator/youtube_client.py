@@ -11,11 +11,49 @@ See the project README for instructions.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-import googleapiclient.discovery
-import googleapiclient.errors
-import isodate
+# Only the fields read below are requested, which keeps the responses small.
+_SEARCH_FIELDS = "nextPageToken,items(id/videoId,snippet(title,channelTitle,publishedAt))"
+_VIDEOS_FIELDS = "items(id,contentDetails/duration)"
+
+# Both search.list and videos.list accept at most 50 results/ids per request
+_PAGE_SIZE = 50
+
+# YouTube durations are ISO 8601 of the form P[nD]T[nH][nM][nS]
+_DURATION_RE = re.compile(r"P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?")
+
+
+@functools.lru_cache(maxsize=None)
+def _client():
+    """Return the shared HTTP client, creating it (and importing httpx) on first use.
+
+    The two endpoints are plain GETs, so a single client is shared by all
+    requests instead of building a discovery-based service object. Its pooled
+    HTTP/2 connection is kept alive across the search and videos calls.
+    """
+    import httpx
+
+    return httpx.Client(
+        base_url="https://www.googleapis.com/youtube/v3",
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        timeout=10.0,
+    )
+
+
+class Video(NamedTuple):
+    """A YouTube video found by :func:`search_videos`."""
+
+    title: str
+    channel: str
+    video_id: str
+    url: str
+    published_at: str
+    duration: str  # "minutes:seconds", or "" if unknown
 
 
 def search_videos(
@@ -23,7 +61,8 @@ def search_videos(
     query: str,
     max_results: int = 10,
     order: str = "relevance",
-) -> List[Dict[str, str]]:
+    fetch_durations: bool = True,
+) -> List[Video]:
     """Search for videos matching the query term.
 
     Parameters
@@ -35,60 +74,100 @@ def search_videos(
         Search term. The API’s `q` parameter specifies the query term【674794175442299†L360-L370】.
         You can use Boolean operators (e.g. "React tutorial|guide -redux").
     max_results: int, optional
-        Number of search results to return. The API supports 0–50; default 10【674794175442299†L315-L318】.
+        Number of search results to return. The API returns at most 50 per
+        page【674794175442299†L315-L318】; larger values are fetched across
+        several pages. Default is 10.
     order: str, optional
         Ordering of results. Acceptable values include 'date', 'rating',
         'relevance' (default), 'title', 'viewCount'【674794175442299†L331-L344】.
+    fetch_durations: bool, optional
+        Whether to look up video durations with the extra ``videos.list``
+        request. When False, 'duration' is an empty string. Default is True.
 
     Returns
     -------
-    list of dict
-        Each dictionary contains keys: 'title', 'channel', 'video_id', 'url',
-        'published_at', and 'duration' (ISO 8601 duration).
+    list of Video
+        Each record has the fields 'title', 'channel', 'video_id', 'url',
+        'published_at', and 'duration' (formatted as "minutes:seconds").
+
+    Search results and durations are cached for the lifetime of the
+    process; failed requests are not cached.
     """
-    # Build YouTube service using the API key (no OAuth required)
-    youtube = googleapiclient.discovery.build(
-        "youtube", "v3", developerKey=api_key, cache_discovery=False
+    videos, _ = search_videos_with_status(
+        api_key, query, max_results, order, fetch_durations
     )
+    return videos
+
+
+def search_videos_with_status(
+    api_key: str,
+    query: str,
+    max_results: int = 10,
+    order: str = "relevance",
+    fetch_durations: bool = True,
+) -> Tuple[List[Video], bool]:
+    """Like :func:`search_videos`, but also report whether every request succeeded.
+
+    Returns
+    -------
+    tuple of (list of Video, bool)
+        The videos, and False if the search failed or, when
+        ``fetch_durations`` is set, any duration lookup failed.
+    """
+    import httpx
+
     try:
-        # Search for videos
-        search_response = (
-            youtube.search()
-            .list(
-                part="snippet",
-                q=query,
-                type="video",  # restrict results to videos【674794175442299†L478-L488】
-                maxResults=max_results,
-                order=order,
-            )
-            .execute()
+        videos = list(_search_videos(api_key, query, max_results, order))
+    except httpx.HTTPError as exc:
+        print(f"YouTube API error: {_describe_error(exc)}")
+        return [], False
+    complete = True
+    if fetch_durations and videos:
+        durations, complete = _lookup_durations(
+            api_key, [video.video_id for video in videos]
         )
-    except googleapiclient.errors.HttpError as exc:
-        print(f"YouTube API error: {exc}")
-        return []
-
-    items = search_response.get("items", [])
-    if not items:
-        return []
-    # Collect video IDs
-    video_ids = [item["id"]["videoId"] for item in items]
-    # Fetch durations
-    durations: Dict[str, str] = {}
-    try:
-        video_response = (
-            youtube.videos()
-            .list(part="contentDetails", id=",".join(video_ids))
-            .execute()
+        videos = [
+            video._replace(duration=durations.get(video.video_id, ""))
+            for video in videos
+        ]
+    return videos, complete
+
+
+@functools.lru_cache(maxsize=256)
+def _search_videos(
+    api_key: str, query: str, max_results: int, order: str
+) -> Tuple[Video, ...]:
+    """Run the search without durations; an ``httpx.HTTPError`` propagates."""
+    # Search for videos (API key only, no OAuth required; sent as a header so
+    # it never appears in request URLs), following page
+    # tokens until enough results have been collected
+    items: List[dict] = []
+    page_token: Optional[str] = None
+    while len(items) < max_results:
+        params = {
+            "part": "snippet",
+            "q": query,
+            "type": "video",  # restrict results to videos【674794175442299†L478-L488】
+            "maxResults": min(_PAGE_SIZE, max_results - len(items)),
+            "order": order,
+            "fields": _SEARCH_FIELDS,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        response = _client().get(
+            "/search", params=params, headers={"X-Goog-Api-Key": api_key}
         )
-        for vid in video_response.get("items", []):
-            vid_id = vid["id"]
-            duration = vid["contentDetails"]["duration"]  # ISO 8601
-            durations[vid_id] = duration
-    except googleapiclient.errors.HttpError:
-        # If this call fails, we still return videos without durations
-        pass
-
-    results: List[Dict[str, str]] = []
+        response.raise_for_status()
+        search_response = response.json()
+        page_items = search_response.get("items", [])
+        items.extend(page_items)
+        page_token = search_response.get("nextPageToken")
+        # Stop on the last page, and on an empty page even if it carries a
+        # token, so a misbehaving response cannot spend quota indefinitely
+        if not page_token or not page_items:
+            break
+
+    results: List[Video] = []
     for item in items:
         vid_id = item["id"]["videoId"]
         snippet = item.get("snippet", {})
@@ -96,25 +175,95 @@ def search_videos(
         channel = snippet.get("channelTitle", "")
         published_at = snippet.get("publishedAt", "")
         url = f"https://www.youtube.com/watch?v={vid_id}"
-        duration_iso = durations.get(vid_id)
-        # Convert duration to human‑readable minutes
-        duration_str = ""
-        if duration_iso:
-            try:
-                duration_td = isodate.parse_duration(duration_iso)
-                minutes = int(duration_td.total_seconds() // 60)
-                seconds = int(duration_td.total_seconds() % 60)
-                duration_str = f"{minutes}:{seconds:02d}"
-            except (ValueError, TypeError):
-                duration_str = duration_iso
         results.append(
-            {
-                "title": title,
-                "channel": channel,
-                "video_id": vid_id,
-                "url": url,
-                "published_at": published_at,
-                "duration": duration_str,
-            }
+            Video(
+                title=title,
+                channel=channel,
+                video_id=vid_id,
+                url=url,
+                published_at=published_at,
+                duration="",
+            )
         )
-    return results
+    return tuple(results)
+
+
+def _describe_error(exc: Exception) -> str:
+    """Return the status and API error message for a failed request."""
+    import httpx
+
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return str(exc)
+    response = exc.response
+    try:
+        message = response.json()["error"]["message"]
+    except (ValueError, KeyError, TypeError):
+        message = response.reason_phrase
+    return f"{response.status_code} {message}"
+
+
+def _lookup_durations(
+    api_key: str, video_ids: List[str]
+) -> Tuple[Dict[str, str], bool]:
+    """Return formatted durations keyed by video ID, and whether all batches succeeded.
+
+    Videos in a ``videos.list`` batch that fails are left out, so they are
+    shown without a duration and looked up again on the next call.
+    """
+    import httpx
+
+    failed = []
+
+    def fetch(id_csv: str) -> Dict[str, str]:
+        try:
+            return _fetch_durations(api_key, id_csv)
+        except httpx.HTTPError:
+            failed.append(id_csv)
+            return {}
+
+    # One videos.list request per page of IDs, each sent as a single
+    # comma-separated id parameter
+    id_batches = [
+        ",".join(video_ids[i : i + _PAGE_SIZE])
+        for i in range(0, len(video_ids), _PAGE_SIZE)
+    ]
+    durations: Dict[str, str] = {}
+    if len(id_batches) == 1:
+        durations.update(fetch(id_batches[0]))
+    else:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for batch_durations in pool.map(fetch, id_batches):
+                durations.update(batch_durations)
+    return durations, not failed
+
+
+@functools.lru_cache(maxsize=256)
+def _fetch_durations(api_key: str, id_csv: str) -> Dict[str, str]:
+    """Return durations for up to 50 comma-separated IDs; errors propagate."""
+    durations: Dict[str, str] = {}
+    if not id_csv:
+        return durations
+    response = _client().get(
+        "/videos",
+        params={
+            "part": "contentDetails",
+            "id": id_csv,
+            "fields": _VIDEOS_FIELDS,
+        },
+        headers={"X-Goog-Api-Key": api_key},
+    )
+    response.raise_for_status()
+    video_response = response.json()
+    for vid in video_response.get("items", []):
+        durations[vid["id"]] = _format_duration(vid["contentDetails"]["duration"])
+    return durations
+
+
+def _format_duration(duration_iso: str) -> str:
+    """Convert an ISO 8601 duration to "minutes:seconds"."""
+    match = _DURATION_RE.fullmatch(duration_iso)
+    if not match:
+        return duration_iso
+    days, hours, mins, secs = (int(g or 0) for g in match.groups())
+    total = ((days * 24 + hours) * 60 + mins) * 60 + secs
+    return f"{total // 60}:{total % 60:02d}"
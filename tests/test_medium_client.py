@@ -0,0 +1,113 @@
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from learning_path_generator import medium_client
+from learning_path_generator.medium_client import Article, _parse_feed, _PartialFeedError
+
+
+def _feed(*items: str) -> bytes:
+    return (
+        '<?xml version="1.0"?>'
+        '<rss xmlns:atom="http://www.w3.org/2005/Atom"'
+        ' xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        "<channel><title>Tag feed</title>" + "".join(items) + "</channel></rss>"
+    ).encode()
+
+
+def _item(title: str, extra: str = "") -> str:
+    return (
+        f"<item><title>{title}</title>"
+        f"<link>https://medium.com/{title}</link>{extra}</item>"
+    )
+
+
+def test_parse_feed_reads_plain_rss_fields():
+    extra = "<pubDate>Mon, 01 Jan 2024</pubDate><description>Intro</description>"
+    assert _parse_feed(_feed(_item("a", extra)), 5) == [
+        Article(
+            title="a",
+            url="https://medium.com/a",
+            published="Mon, 01 Jan 2024",
+            summary="Intro",
+        )
+    ]
+
+
+def test_parse_feed_falls_back_to_namespaced_fields():
+    extra = (
+        "<atom:updated>2024-01-01T00:00:00Z</atom:updated>"
+        "<content:encoded><![CDATA[<p>Body</p>]]></content:encoded>"
+    )
+    (article,) = _parse_feed(_feed(_item("a", extra)), 5)
+    assert article.published == "2024-01-01T00:00:00Z"
+    assert article.summary == "<p>Body</p>"
+
+
+def test_parse_feed_stops_at_max_articles():
+    data = _feed(*(_item(f"a{i}") for i in range(10)))
+    assert [a.title for a in _parse_feed(data, 3)] == ["a0", "a1", "a2"]
+    assert _parse_feed(data, 0) == []
+
+
+def test_parse_feed_malformed_before_first_item_raises():
+    with pytest.raises(ET.ParseError):
+        _parse_feed(_feed(_item("bad &nbsp;"), _item("b")), 5)
+
+
+def test_parse_feed_malformed_after_first_item_keeps_articles():
+    with pytest.raises(_PartialFeedError) as excinfo:
+        _parse_feed(_feed(_item("a"), _item("bad &nbsp;"), _item("c")), 5)
+    assert [a.title for a in excinfo.value.articles] == ["a"]
+
+
+class _FakeResponse:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class _FakeClient:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.requests = 0
+
+    def get(self, url: str) -> _FakeResponse:
+        self.requests += 1
+        return _FakeResponse(self.content)
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    pytest.importorskip("httpx")
+    medium_client._get_articles_for_tag.cache_clear()
+    client = _FakeClient(b"")
+    monkeypatch.setattr(medium_client, "_client", lambda: client)
+    yield client
+    medium_client._get_articles_for_tag.cache_clear()
+
+
+def test_partial_feed_is_reported_and_not_cached(fake_client, capsys):
+    fake_client.content = _feed(_item("a"), _item("bad &nbsp;"))
+    articles, complete = medium_client.get_articles_with_status("react", 5)
+    assert [a.title for a in articles] == ["a"]
+    assert not complete
+    assert "Medium feed error" in capsys.readouterr().out
+
+    medium_client.get_articles_with_status("react", 5)
+    assert fake_client.requests == 2
+
+
+def test_complete_feed_is_cached(fake_client):
+    fake_client.content = _feed(_item("a"), _item("b"))
+    assert medium_client.get_articles_with_status("react", 5) == (
+        [
+            Article(title="a", url="https://medium.com/a", published="", summary=""),
+            Article(title="b", url="https://medium.com/b", published="", summary=""),
+        ],
+        True,
+    )
+    medium_client.get_articles_for_tag("react", 5)
+    assert fake_client.requests == 1
@@ -0,0 +1,20 @@
+from learning_path_generator.youtube_client import _format_duration
+
+
+def test_format_duration_minutes_and_seconds():
+    assert _format_duration("PT15M30S") == "15:30"
+    assert _format_duration("PT45S") == "0:45"
+
+
+def test_format_duration_hours_fold_into_minutes():
+    assert _format_duration("PT1H2M3S") == "62:03"
+
+
+def test_format_duration_days():
+    assert _format_duration("P0D") == "0:00"
+    assert _format_duration("P1DT1S") == "1440:01"
+
+
+def test_format_duration_unrecognised_is_returned_unchanged():
+    assert _format_duration("P1W") == "P1W"
+    assert _format_duration("bogus") == "bogus"